@@ -7,20 +7,21 @@ from vedo import *
 
 settings.use_depth_peeling = True
 
-pts = Points(np.random.randn(10_000, 3)*[3,2,1])
+rng = np.random.default_rng(0)
+scale = np.array([3,2,1], dtype=np.float32)  # keeps the points float32
+pts = Points(rng.standard_normal((10_000, 3), dtype=np.float32) * scale)
 pts.rotate_z(45).rotate_x(20).shift([30,40,50])
 
 elli = pca_ellipsoid(pts, pvalue=0.50) # 50% of points inside
 
-ids  = elli.inside_points(pts, return_ids=True)
+elli.inside_points(pts, return_ids=True)
 pts.print()  # a new "IsInside" array now exists in pts.pointdata
-pin = pts.vertices[ids]
-print("inside  points  #", len(pin))
 
-# Create an inverted mask instead of calling inside_points(invert=True)
-mask = np.ones(pts.npoints, dtype=bool)
-mask[ids] = False
-pout = pts.vertices[mask]
+# Use the "IsInside" mask instead of calling inside_points(invert=True)
+mask = pts.pointdata["IsInside"].astype(bool)
+pin  = pts.vertices[mask]
+pout = pts.vertices[~mask]
+print("inside  points  #", len(pin))
 print("outside  points #", len(pout))
 
 # Extra info can be retrieved with:
@@ -1,14 +1,17 @@
 """Include background images in the rendering scene
 (generated by matplotlib)"""
+import matplotlib
+matplotlib.use("Agg")  # figure is only rasterized, no GUI backend needed
 import matplotlib.pyplot as plt
 from vedo import *
 
 tmsh = TetMesh(dataurl + "limb.vtu")
 msh = tmsh.tomesh().shrink(0.8)
 
-# Create a histogram with matplotlib
+# Create a histogram with matplotlib (bin with numpy, draw the bars once)
+counts, edges = np.histogram(msh.celldata["chem_0"], bins=10)  # as plt.hist()
 fig = plt.figure()
-plt.hist(msh.celldata["chem_0"], log=True)
+plt.bar(edges[:-1], counts, width=np.diff(edges), align="edge", log=True)
 plt.title(r"$\mathrm{Matplotlib\ Histogram\ of\ log(chem_0)}$")
 
 # pic1 = Image(fig).clone2d("top-right", 0.5).alpha(0.8)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import numpy as np
+from vedo import Sphere
+from vedo.applications import Animation
+
+sphere = Sphere(res=12)
+anim = Animation(show_progressbar=False)
+anim.mesh_erode(sphere, corner=6, t=0, duration=1)
+erode_events = [e for e in anim.events if e[1] == anim.mesh_erode]
+print("mesh_erode frames", len(erode_events))
+assert len(erode_events[0][3]) == 0  # nothing is removed at the first frame
+
+# same points as the old per-frame radius queries of the point locator
+corner = np.array(sphere.bounds()).reshape(3, 2)[:, 1]
+dmin = np.linalg.norm(sphere.closest_point(corner) - corner)
+radii = np.linspace(dmin, sphere.diagonal_size() * 1.01, len(erode_events))
+for (tt, _, _, ids), d in zip(erode_events, radii):
+    ref = sphere.closest_point(corner, radius=d, return_point_id=True)
+    assert len(ids) == len(ref), (tt, len(ids), len(ref))
+    assert set(ids.tolist()) == set(np.asarray(ref).tolist())
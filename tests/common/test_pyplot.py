@@ -7,6 +7,17 @@ from vedo.pyplot import Figure, pie_chart
 
 settings.use_parallel_projection = True
 
+######################################################################## histogram
+import numpy as np
+from vedo.pyplot import histogram
+
+data = np.linspace(0, 1, 1001)  # many values sit exactly on the bin edges
+h = histogram(data, bins=10, xlim=(0, 1))
+nfs, nedges = np.histogram(data, bins=10, range=(0, 1))
+print("histogram frequencies", h.frequencies)
+assert np.array_equal(h.frequencies, nfs)
+assert np.allclose(h.edges, nedges)
+
 fig = Figure([-1,12], [-2,14], aspect=16/9, padding=0,
     title="Lorem Ipsum Neque porro quisquam",
     xtitle="test x-axis should always align",
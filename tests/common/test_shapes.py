@@ -9,3 +9,21 @@ print('-----------------------------------------------------')
 #####################################
 arc = Arc(center=None, point1=(1, 1, 1), point2=None, normal=(0, 0, 1), angle=np.pi)
 assert isinstance(arc, Arc)
+
+#####################################
+from vedo import Ellipsoid, Mesh, Points
+
+rng = np.random.default_rng(0)
+pts = Points(rng.uniform(-4, 6, (5000, 3)))
+elli = Ellipsoid(res=24).rotate_x(30).scale(2).pos(1, 2, 3)
+ids = elli.inside_points(pts, return_ids=True)
+ref = Mesh.inside_points(elli, pts, return_ids=True)
+print("Ellipsoid.inside_points", len(ids), len(ref))
+assert np.array_equal(ids, ref)
+
+# an open half-shell is not an ellipsoid anymore
+cut = Ellipsoid(res=120).cut_with_plane(origin=(0, 0, 0), normal=(1, 0, 0))
+ids = cut.inside_points(pts, return_ids=True)
+ref = Mesh.inside_points(cut, pts, return_ids=True)
+print("cut Ellipsoid.inside_points", len(ids), len(ref))
+assert np.array_equal(ids, ref)
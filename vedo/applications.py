@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import math
 import os
 import time
+from collections import OrderedDict, deque
 import numpy as np
 from typing import Union
 
 import vedo.vtkclasses as vtki
 
 import vedo
-from vedo.colors import color_map, get_color
-from vedo.utils import is_sequence, lin_interpolate, mag, precision
+from vedo.colors import get_color
+from vedo.utils import is_sequence, mag, precision, polyline_cells, vertex_cells
 from vedo.plotter import Plotter
 from vedo.pointcloud import fit_plane, Points
 from vedo.shapes import Line, Ribbon, Spline, Text2D
@@ -40,6 +42,77 @@ __all__ = [
 
 
 #################################
+def _log_clamp_range(data, rmin, rmax, bins=50):
+    """
+    Clamp the scalar range `(rmin, rmax)` of `data` around the mean
+    of its log-scaled histogram, to reduce the effect of tails in color mapping.
+    """
+    # ~1M values are enough to sample the distribution,
+    # counts are scaled back so that the log weights are comparable
+    step = max(1, len(data) // 1_000_000)
+    sample = data[::step]
+    if sample.ndim == 1 and np.issubdtype(sample.dtype, np.integer) and rmax > rmin:
+        # integer scalars (e.g. CT data) are binned directly, with no edge search
+        lo, span = int(rmin), int(rmax) - int(rmin)
+        ids = (sample.astype(np.int64) - lo) * bins // span
+        hdata = np.bincount(np.clip(ids, 0, bins - 1), minlength=bins)
+        edg = np.linspace(rmin, rmax, bins + 1)
+    else:
+        hdata = None
+        if rmax > rmin:  # fast_histogram needs a non-empty range
+            try:
+                from fast_histogram import histogram1d
+                hdata = histogram1d(sample, bins=bins, range=(rmin, rmax))
+                # np.histogram also counts the values sitting on the last edge
+                hdata[-1] += np.count_nonzero(sample == rmax)
+                edg = np.linspace(rmin, rmax, bins + 1)
+            except (ModuleNotFoundError, ValueError):
+                pass
+        if hdata is None:
+            hdata, edg = np.histogram(sample, bins=bins)
+    logdata = np.log(hdata * step + 1)
+    # mean  of the logscale plot
+    meanlog = float(edg[:-1] @ logdata) / float(logdata.sum())
+    rmax = min(rmax, meanlog + (meanlog - rmin) * 0.9)
+    rmin = max(rmin, meanlog - (rmax - meanlog) * 0.9)
+    return rmin, rmax
+
+
+def _uniform_histogram(data, bins, rmin, rmax):
+    """
+    Counts and edges of `data` in `bins` uniform bins over `(rmin, rmax)`,
+    computed with fast_histogram when it is installed.
+    Values sitting exactly on an inner edge may land in a different bin
+    than with `np.histogram`, so use this only where that does not matter.
+    """
+    if rmax > rmin:  # fast_histogram needs a non-empty range
+        try:
+            from fast_histogram import histogram1d
+        except ModuleNotFoundError:
+            pass
+        else:
+            counts = histogram1d(data, bins=bins, range=(rmin, rmax))
+            # np.histogram also counts the values sitting on the last edge
+            counts[-1] += np.count_nonzero(data == rmax)
+            return counts, np.linspace(rmin, rmax, bins + 1)
+    return np.histogram(data, bins=bins, range=(rmin, rmax))
+
+
+def _remove_slice(plt, msh, at):
+    """
+    Remove a slice mesh from renderer `at` of `plt` through its actor,
+    instead of letting `Plotter.remove()` search all the actors in the scene.
+    """
+    if msh is None:
+        return
+    plt.renderers[at].RemoveActor(msh.actor)
+    msh.rendered_at.discard(at)
+    try:
+        plt.objects.remove(msh)
+    except ValueError:  # the slice was at the border and never added
+        pass
+
+
 class Slicer3DPlotter(Plotter):
     """
     Generate a rendering window with slicing planes for the input Volume.
@@ -133,12 +206,7 @@ class Slicer3DPlotter(Plotter):
         data = volume.pointdata[0]
         rmin, rmax = volume.scalar_range()
         if clamp:
-            hdata, edg = np.histogram(data, bins=50)
-            logdata = np.log(hdata + 1)
-            # mean  of the logscale plot
-            meanlog = np.sum(np.multiply(edg[:-1], logdata)) / np.sum(logdata)
-            rmax = min(rmax, meanlog + (meanlog - rmin) * 0.9)
-            rmin = max(rmin, meanlog - (rmax - meanlog) * 0.9)
+            rmin, rmax = _log_clamp_range(data, rmin, rmax)
             # print("scalar range clamped to range: ("
             #       + precision(rmin, 3) + ", " + precision(rmax, 3) + ")")
 
@@ -158,62 +226,109 @@ class Slicer3DPlotter(Plotter):
         self.add(self.zslice)
 
         self.histogram = None
+        # one 2D histogram per colormap, built the first time it is shown
+        self._histograms = {}
         data_reduced = data
-        if show_histo:
-            # try to reduce the number of values to histogram
-            dims = self.volume.dimensions()
-            n = (dims[0] - 1) * (dims[1] - 1) * (dims[2] - 1)
-            n = min(1_000_000, n)
-            if data.ndim == 1:
-                data_reduced = np.random.choice(data, n)
-                self.histogram = histogram(
+
+        def make_histogram(cmap):
+            h = self._histograms.get(cmap)
+            if h is None:
+                h = histogram(
                     data_reduced,
                     # title=volume.filename,
                     bins=20,
                     logscale=True,
-                    c=self.cmap_slicer,
+                    c=cmap,
                     bg=ch,
                     alpha=1,
                     axes=dict(text_scale=2),
                 ).clone2d(pos=[-0.925, -0.88], size=0.4)
+                self._histograms[cmap] = h
+            return h
+
+        if show_histo:
+            # try to reduce the number of values to histogram
+            dims = self.volume.dimensions()
+            n = (dims[0] - 1) * (dims[1] - 1) * (dims[2] - 1)
+            n = min(1_000_000, n)
+            if data.ndim == 1:
+                # a strided view is enough to sample a 20-bin histogram
+                data_reduced = data[:: max(1, data.size // n)]
+                self.histogram = make_histogram(self.cmap_slicer)
                 self.add(self.histogram)
 
         #################
+        # the last few slices visited along each axis, so that dragging a
+        # slider back and forth does not extract the same slice again
+        self._slice_cache = {"X": OrderedDict(), "Y": OrderedDict(), "Z": OrderedDict()}
+        self._slice_cache_size = 3  # per axis
+
+        def get_slice(axis, i):
+            cache = self._slice_cache[axis]
+            msh = cache.get(i)
+            if msh is None:
+                if axis == "X":
+                    msh = volume.xslice(i)
+                elif axis == "Y":
+                    msh = volume.yslice(i)
+                else:
+                    msh = volume.zslice(i)
+                msh.lighting("", la, ld, 0)
+                msh.cmap(self.cmap_slicer, vmin=rmin, vmax=rmax)
+                msh.name = axis + "Slice"
+                cache[i] = msh
+                if len(cache) > self._slice_cache_size:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(i)
+            return msh
+
+        # coalesce fast slider drags to the animation rate,
+        # the final EndInteractionEvent is never skipped
+        self._last_render_t = 0.0
+        self._min_render_interval = 0.016  # seconds
+
+        def throttled(event):
+            if event != "InteractionEvent":
+                return False
+            t = time.perf_counter()
+            if t - self._last_render_t < self._min_render_interval:
+                return True
+            self._last_render_t = t
+            return False
+
         def slider_function_x(widget, event):
             i = int(self.xslider.value)
-            if i == self.current_i:
+            if i == self.current_i or throttled(event):
                 return
             self.current_i = i
-            self.xslice = volume.xslice(i).lighting("", la, ld, 0)
-            self.xslice.cmap(self.cmap_slicer, vmin=rmin, vmax=rmax)
-            self.xslice.name = "XSlice"
-            self.remove("XSlice")  # removes the old one
+            old = self.xslice
+            self.xslice = get_slice("X", i)
+            _remove_slice(self, old, self.renderers.index(self.renderer))
             if 0 < i < dims[0]:
                 self.add(self.xslice)
             self.render()
 
         def slider_function_y(widget, event):
             j = int(self.yslider.value)
-            if j == self.current_j:
+            if j == self.current_j or throttled(event):
                 return
             self.current_j = j
-            self.yslice = volume.yslice(j).lighting("", la, ld, 0)
-            self.yslice.cmap(self.cmap_slicer, vmin=rmin, vmax=rmax)
-            self.yslice.name = "YSlice"
-            self.remove("YSlice")
+            old = self.yslice
+            self.yslice = get_slice("Y", j)
+            _remove_slice(self, old, self.renderers.index(self.renderer))
             if 0 < j < dims[1]:
                 self.add(self.yslice)
             self.render()
 
         def slider_function_z(widget, event):
             k = int(self.zslider.value)
-            if k == self.current_k:
+            if k == self.current_k or throttled(event):
                 return
             self.current_k = k
-            self.zslice = volume.zslice(k).lighting("", la, ld, 0)
-            self.zslice.cmap(self.cmap_slicer, vmin=rmin, vmax=rmax)
-            self.zslice.name = "ZSlice"
-            self.remove("ZSlice")
+            old = self.zslice
+            self.zslice = get_slice("Z", k)
+            _remove_slice(self, old, self.renderers.index(self.renderer))
             if 0 < k < dims[2]:
                 self.add(self.zslice)
             self.render()
@@ -285,25 +400,24 @@ class Slicer3DPlotter(Plotter):
                 show_value=False,
             )
 
+        for slider, func in zip(
+            (self.xslider, self.yslider, self.zslider),
+            (slider_function_x, slider_function_y, slider_function_z),
+        ):
+            slider.AddObserver("EndInteractionEvent", func)
+
         #################
         def button_func(obj, ename):
             bu.switch()
             self.cmap_slicer = bu.status()
-            for m in self.objects:
-                if "Slice" in m.name:
+            for cache in self._slice_cache.values():
+                cache.clear()  # cached slices have the old colormap
+            for m in (self.xslice, self.yslice, self.zslice):
+                if m is not None:
                     m.cmap(self.cmap_slicer, vmin=rmin, vmax=rmax)
-            self.remove(self.histogram)
-            if show_histo:
-                self.histogram = histogram(
-                    data_reduced,
-                    # title=volume.filename,
-                    bins=20,
-                    logscale=True,
-                    c=self.cmap_slicer,
-                    bg=ch,
-                    alpha=1,
-                    axes=dict(text_scale=2),
-                ).clone2d(pos=[-0.925, -0.88], size=0.4)
+            if self.histogram is not None:
+                self.remove(self.histogram)
+                self.histogram = make_histogram(self.cmap_slicer)
                 self.add(self.histogram)
             self.render()
 
@@ -382,22 +496,23 @@ class Slicer3DTwinPlotter(Plotter):
         data = vol1.pointdata[0]
         rmin, rmax = vol1.scalar_range()
         if clamp:
-            hdata, edg = np.histogram(data, bins=50)
-            logdata = np.log(hdata + 1)
-            meanlog = np.sum(np.multiply(edg[:-1], logdata)) / np.sum(logdata)
-            rmax = min(rmax, meanlog + (meanlog - rmin) * 0.9)
-            rmin = max(rmin, meanlog - (rmax - meanlog) * 0.9)
+            rmin, rmax = _log_clamp_range(data, rmin, rmax)
+
+        # the slices currently shown in the two renderers, per axis
+        self._slices = {"X": (None, None), "Y": (None, None), "Z": (None, None)}
 
         def slider_function_x(widget, event):
             i = int(self.xslider.value)
             msh1 = vol1.xslice(i).lighting("", ambient, diffuse, 0)
             msh1.cmap(cmap, vmin=rmin, vmax=rmax)
             msh1.name = "XSlice"
-            self.at(0).remove("XSlice")  # removes the old one
             msh2 = vol2.xslice(i).lighting("", ambient, diffuse, 0)
             msh2.cmap(cmap, vmin=rmin, vmax=rmax)
             msh2.name = "XSlice"
-            self.at(1).remove("XSlice")
+            old1, old2 = self._slices["X"]
+            _remove_slice(self, old1, 0)
+            _remove_slice(self, old2, 1)
+            self._slices["X"] = (msh1, msh2)
             if 0 < i < dims[0]:
                 self.at(0).add(msh1)
                 self.at(1).add(msh2)
@@ -407,11 +522,13 @@ class Slicer3DTwinPlotter(Plotter):
             msh1 = vol1.yslice(i).lighting("", ambient, diffuse, 0)
             msh1.cmap(cmap, vmin=rmin, vmax=rmax)
             msh1.name = "YSlice"
-            self.at(0).remove("YSlice")
             msh2 = vol2.yslice(i).lighting("", ambient, diffuse, 0)
             msh2.cmap(cmap, vmin=rmin, vmax=rmax)
             msh2.name = "YSlice"
-            self.at(1).remove("YSlice")
+            old1, old2 = self._slices["Y"]
+            _remove_slice(self, old1, 0)
+            _remove_slice(self, old2, 1)
+            self._slices["Y"] = (msh1, msh2)
             if 0 < i < dims[1]:
                 self.at(0).add(msh1)
                 self.at(1).add(msh2)
@@ -421,11 +538,13 @@ class Slicer3DTwinPlotter(Plotter):
             msh1 = vol1.zslice(i).lighting("", ambient, diffuse, 0)
             msh1.cmap(cmap, vmin=rmin, vmax=rmax)
             msh1.name = "ZSlice"
-            self.at(0).remove("ZSlice")
             msh2 = vol2.zslice(i).lighting("", ambient, diffuse, 0)
             msh2.cmap(cmap, vmin=rmin, vmax=rmax)
             msh2.name = "ZSlice"
-            self.at(1).remove("ZSlice")
+            old1, old2 = self._slices["Z"]
+            _remove_slice(self, old1, 0)
+            _remove_slice(self, old2, 1)
+            self._slices["Z"] = (msh1, msh2)
             if 0 < i < dims[2]:
                 self.at(0).add(msh1)
                 self.at(1).add(msh2)
@@ -471,6 +590,77 @@ class Slicer3DTwinPlotter(Plotter):
 
 
 ########################################################################################
+class _PointBuffer:
+    """Internal use. A growable (n, 3) array of points with amortized O(1) appends."""
+
+    def __init__(self, capacity=64):
+        self._data = np.empty((capacity, 3))
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def array(self) -> np.ndarray:
+        """A view of the stored points."""
+        return self._data[: self.n]
+
+    def _reserve(self, n):
+        if n > len(self._data):
+            data = np.empty((max(n, 2 * len(self._data)), 3))
+            data[: self.n] = self._data[: self.n]
+            self._data = data
+
+    def append(self, p):
+        self._reserve(self.n + 1)
+        self._data[self.n] = p
+        self.n += 1
+
+    def extend(self, pts):
+        pts = np.reshape(pts, (-1, 3))
+        self._reserve(self.n + len(pts))
+        self._data[self.n : self.n + len(pts)] = pts
+        self.n += len(pts)
+
+    def truncate(self, n):
+        self.n = min(max(n, 0), self.n)
+
+    def pop(self, i=-1):
+        i = range(self.n)[i]
+        self._data[i : self.n - 1] = self._data[i + 1 : self.n]
+        self.n -= 1
+
+    def clear(self):
+        self.n = 0
+
+
+def _catmull_rom(pts, res):
+    """Internal use. Sample `res` points on the uniform Catmull-Rom curve through `pts`."""
+    pts = np.asarray(pts, dtype=float)
+    p = np.concatenate([pts[:1], pts, pts[-1:]])  # repeat the end points
+    nseg = len(pts) - 1
+    t = np.linspace(0, nseg, res)
+    i = np.minimum(t.astype(int), nseg - 1)
+    u = (t - i)[:, None]
+    p0, p1, p2, p3 = p[i], p[i + 1], p[i + 2], p[i + 3]
+    return 0.5 * (
+        2 * p1
+        + (p2 - p0) * u
+        + (2 * p0 - 5 * p1 + 4 * p2 - p3) * u**2
+        + (3 * p1 - p0 - 3 * p2 + p3) * u**3
+    )
+
+
+def _gauss(x, A, B, sigma):
+    return A + B * np.exp(-x**2 / (2 * sigma**2))
+
+def _gauss_jac(x, A, B, sigma):
+    # analytic jacobian of _gauss() w.r.t. (A, B, sigma), saves curve_fit
+    # from estimating it by finite differences
+    e = np.exp(-x**2 / (2 * sigma**2))
+    return np.c_[np.ones_like(x), e, B * e * x**2 / sigma**3]
+
+
 class MorphPlotter(Plotter):
     """
     A Plotter with 3 renderers to show the source, target and warped meshes.
@@ -493,14 +683,19 @@ class MorphPlotter(Plotter):
         self.source = source.pickable(True)
         self.target = target.pickable(False)
         self.clicked = []
-        self.sources = []
-        self.targets = []
+        self._sources = _PointBuffer()
+        self._targets = _PointBuffer()
         self.warped = None
         self.source_labels = None
         self.target_labels = None
         self.automatic_picking_distance = 0.075
         self.cmap_name = "coolwarm"
         self.nbins = 25
+        try:  # resolved once here instead of on every keypress
+            from scipy.optimize import curve_fit
+            self._curve_fit = curve_fit
+        except ModuleNotFoundError:
+            self._curve_fit = None
         self.msg0 = Text2D("Pick a point on the surface",
                            pos="bottom-center", c='white', bg="blue4", alpha=1, font="Calco")
         self.msg1 = Text2D(pos="bottom-center", c='white', bg="blue4", alpha=1, font="Calco")
@@ -527,23 +722,55 @@ class MorphPlotter(Plotter):
         self.camera = cam1  # use the same camera of renderer1
 
         self.add_renderer_frame()
-    
+
+        # the landmark actors are created once, update() only changes their points
+        self.source_pts = Points(np.zeros((0, 3))).color("purple5").ps(12)
+        self.target_pts = Points(np.zeros((0, 3))).color("purple5").ps(12)
+        self.source_pts.name = "source_pts"
+        self.target_pts.name = "target_pts"
+        self.source_pts.dataset.SetPoints(vtki.vtkPoints())  # empty clouds have none
+        self.target_pts.dataset.SetPoints(vtki.vtkPoints())
+        self.source_labels = self.source_pts.labels2d("id", c="purple3")
+        self.target_labels = self.target_pts.labels2d("id", c="purple3")
+        self.source_labels.name = "source_pts"
+        self.target_labels.name = "target_pts"
+        self.at(0).add(self.source_pts, self.source_labels)
+        self.at(1).add(self.target_pts, self.target_labels)
+
         self.callid1 = self.add_callback("KeyPress", self.on_keypress)
         self.callid2 = self.add_callback("LeftButtonPress", self.on_click)
         self._interactive = True
 
+    @property
+    def sources(self) -> np.ndarray:
+        """The picked source landmarks, as a (n, 3) array."""
+        return self._sources.array
+
+    @sources.setter
+    def sources(self, pts):
+        self._sources.clear()
+        self._sources.extend(pts)
+
+    @property
+    def targets(self) -> np.ndarray:
+        """The picked target landmarks, as a (n, 3) array."""
+        return self._targets.array
+
+    @targets.setter
+    def targets(self, pts):
+        self._targets.clear()
+        self._targets.extend(pts)
+
     ################################################
     def update(self):
-        source_pts = Points(self.sources).color("purple5").ps(12)
-        target_pts = Points(self.targets).color("purple5").ps(12)
-        source_pts.name = "source_pts"
-        target_pts.name = "target_pts"
-        self.source_labels = source_pts.labels2d("id", c="purple3")
-        self.target_labels = target_pts.labels2d("id", c="purple3")
-        self.source_labels.name = "source_pts"
-        self.target_labels.name = "target_pts"
-        self.at(0).remove("source_pts").add(source_pts, self.source_labels)
-        self.at(1).remove("target_pts").add(target_pts, self.target_labels)
+        for pts, landmarks in (
+            (self.source_pts, self.sources),
+            (self.target_pts, self.targets),
+        ):
+            n = pts.npoints
+            pts.vertices = np.reshape(landmarks, (-1, 3))
+            if pts.npoints != n:
+                pts.dataset.SetVerts(vertex_cells(pts.npoints))
         self.render()
 
         if len(self.sources) == len(self.targets) and len(self.sources) > 3:
@@ -554,14 +781,14 @@ class MorphPlotter(Plotter):
 
     def on_click(self, evt):
         if evt.object == self.source:
-            self.sources.append(evt.picked3d)
+            self._sources.append(evt.picked3d)
             self.source.pickable(False)
             self.target.pickable(True)
             self.msg0.text("--->")
             self.msg1.text("now pick a target point")
             self.update()
         elif evt.object == self.target:
-            self.targets.append(evt.picked3d)
+            self._targets.append(evt.picked3d)
             self.source.pickable(True)
             self.target.pickable(False)
             self.msg0.text("now pick a source point")
@@ -570,10 +797,8 @@ class MorphPlotter(Plotter):
 
     def on_keypress(self, evt):
         if evt.keypress == "c":
-            self.sources.clear()
-            self.targets.clear()
-            self.at(0).remove("source_pts")
-            self.at(1).remove("target_pts")
+            self._sources.clear()
+            self._targets.clear()
             self.at(2).remove("warped")
             self.msg0.text("CLEARED! Pick a point here")
             self.msg1.text("")
@@ -585,9 +810,9 @@ class MorphPlotter(Plotter):
             self.warped.wireframe(not rep)
             self.render()
         if evt.keypress == "d":
-            n = min(len(self.sources), len(self.targets))
-            self.sources = self.sources[:n-1]
-            self.targets = self.targets[:n-1]
+            n = min(len(self._sources), len(self._targets))
+            self._sources.truncate(n - 1)
+            self._targets.truncate(n - 1)
             self.msg0.text("Last point deleted! Pick a point here")
             self.msg1.text("")
             self.source.pickable(True)
@@ -599,28 +824,40 @@ class MorphPlotter(Plotter):
                 vedo.printc("At least 4 points are needed.", c="r")
                 return
             pts = self.target.clone().subsample(self.automatic_picking_distance)
-            if len(self.sources) > len(self.targets):
-                self.sources.pop()
+            self._sources.truncate(len(self._targets))
             d = self.target.diagonal_size()
             r = d * self.automatic_picking_distance
             TI = self.warped.transform.compute_inverse()
-            for p in pts.coordinates:
-                pp = vedo.utils.closest(p, self.targets)[1]
-                if vedo.mag(pp - p) < r:
-                    continue
-                q = self.warped.closest_point(p)
-                self.sources.append(TI(q))
-                self.targets.append(p)
+            # discard candidates too close to an existing target landmark
+            from scipy.spatial import KDTree
+            pts = pts.coordinates
+            dists, _ = KDTree(self.targets).query(pts)
+            pts = pts[dists >= r]
+            # build the cell locator once, then query it directly
+            locator = vtki.new("StaticCellLocator")
+            locator.SetDataSet(self.warped.dataset)
+            locator.BuildLocator()
+            q = [0, 0, 0]
+            cid, subid, dist2 = vtki.mutable(0), vtki.mutable(0), vtki.mutable(0)
+            qs = []
+            for p in pts:
+                locator.FindClosestPoint(p, q, cid, subid, dist2)
+                qs.append(TI.transform_point(q))
+            self._sources.extend(qs)
+            self._targets.extend(pts)
             self.source.pickable(True)
             self.target.pickable(False)
             self.update()            
         if evt.keypress == "z" or evt.keypress == "a":
             dists = self.warped.distance_to(self.target, signed=True)
-            v = np.std(dists) * 2
+            v = dists.std() * 2
             self.warped.cmap(self.cmap_name, dists, vmin=-v, vmax=+v)
 
+            # the residuals are binned here, the figure gets one weighted entry per bin
+            counts, edges = _uniform_histogram(dists, self.nbins, -v, v)
             h = vedo.pyplot.histogram(
-                dists, 
+                (edges[:-1] + edges[1:]) / 2,
+                weights=counts,
                 bins=self.nbins,
                 title=" ",
                 xtitle=f"STD = {v/2:.2f}",
@@ -636,17 +873,17 @@ class MorphPlotter(Plotter):
             )
 
             # try to fit a gaussian to the histogram
-            def gauss(x, A, B, sigma):
-                return A + B * np.exp(-x**2 / (2 * sigma**2))
-            try:
-                from scipy.optimize import curve_fit
-                inits = [0, len(dists)/self.nbins*2.5, v/2]
-                popt, _ = curve_fit(gauss, xdata=h.centers, ydata=h.frequencies, p0=inits)
-                x = np.linspace(-v, v, 300)
-                h += vedo.pyplot.plot(x, gauss(x, *popt), like=h, lw=1, lc="k2")
-                h["Axes"]["xtitle"].text(f":sigma = {abs(popt[2]):.3f}", font="VictorMono")
-            except:
-                pass
+            if self._curve_fit is not None:
+                try:
+                    inits = [0, len(dists)/self.nbins*2.5, v/2]
+                    popt, _ = self._curve_fit(
+                        _gauss, xdata=h.centers, ydata=h.frequencies, p0=inits, jac=_gauss_jac
+                    )
+                    x = np.linspace(-v, v, 300)
+                    h += vedo.pyplot.plot(x, _gauss(x, *popt), like=h, lw=1, lc="k2")
+                    h["Axes"]["xtitle"].text(f":sigma = {abs(popt[2]):.3f}", font="VictorMono")
+                except:
+                    pass
 
             h = h.clone2d(pos="bottom-left", size=0.575)
             h.name = "warped"
@@ -741,7 +978,8 @@ class Slicer2DPlotter(Plotter):
                 dims = self.volume.dimensions()
                 n = (dims[0] - 1) * (dims[1] - 1) * (dims[2] - 1)
                 n = min(1_000_000, n)
-                arr = np.random.choice(self.volume.pointdata[0], n)
+                # a strided view is enough to sample a 12-bin histogram
+                arr = data[:: max(1, data.size // n)]
                 hist = vedo.pyplot.histogram(
                     arr,
                     bins=12,
@@ -933,10 +1171,6 @@ class RayCastPlotter(Plotter):
             "coolwarm", "coolwarm_r",
             "tab10_r",
         ]
-        cols_cmaps = []
-        for cm in cmaps:
-            cols = color_map(range(0, 21), cm, 0, 20)  # sample 20 colors
-            cols_cmaps.append(cols)
         Ncols = len(cmaps)
         csl = "k9"
         if sum(get_color(self.background())) > 1.5:
@@ -972,7 +1206,11 @@ class RayCastPlotter(Plotter):
             otf.AddPoint(x0alpha, self.alphaslider0)
             otf.AddPoint(x1alpha, self.alphaslider1)
             otf.AddPoint(x2alpha, self.alphaslider2)
-            slider_cmap()
+            if self.color_scalarbar is None:
+                slider_cmap()
+            else:
+                # only the opacities changed: refresh the bar colors in place
+                self.color_scalarbar.SetLookupTable(vedo.utils.ctf2lut(volume))
 
         setOTF()  ################
 
@@ -1141,9 +1379,13 @@ class IsosurfaceBrowser(Plotter):
                 value = widget.GetRepresentation().GetValue()
                 isovals.SetValue(0, value)
 
+            # the fixed point mapper cannot ray cast an isosurface
+            if isinstance(volume.mapper, vtki.get_class("FixedPointVolumeRayCastMapper")):
+                volume.mapper = "smart"
+
             isovals = volume.properties.GetIsoSurfaceValues()
             isovals.SetValue(0, isovalue)
-            self.add(volume.mode(5).alpha(alpha).cmap(c))
+            self.add(volume.mode(5).alpha(alpha).cmap(c))  # 5 = isosurface blending
 
             self.slider = self.add_slider(
                 slider_isovalue,
@@ -1173,62 +1415,66 @@ class IsosurfaceBrowser(Plotter):
                 slidertitle = "scalar value"
 
             allowed_vals = np.linspace(scrange[0], scrange[1], num=res)
-
-            bacts = {}  # cache the meshes so we dont need to recompute
+            step = delta / max(1, res - 1)
+
+            # a single flying edges filter serves all the isovalues
+            isofilter = vtki.new("FlyingEdges3D")
+            isofilter.InterpolateAttributesOn()
+            isofilter.ComputeNormalsOn()
+            isofilter.SetInputData(volume.dataset)
+
+            def generate(value):
+                if lego:
+                    mesh = volume.legosurface(vmin=value)
+                    if mesh.ncells:
+                        mesh.cmap(cmap, vmin=scrange[0], vmax=scrange[1], on="cells")
+                    return mesh
+                isofilter.SetValue(0, value)
+                isofilter.Update()
+                poly = vtki.vtkPolyData()
+                poly.ShallowCopy(isofilter.GetOutput())  # detach it from the next Update()
+                mesh = volume._isosurface_mesh(poly, scrange)
+                return mesh.color(c).alpha(alpha)
+
+            bacts = [None] * res  # cache the meshes so we dont need to recompute
             if precompute:
                 delayed = False  # no need to delay the slider in this case
 
-                for value in allowed_vals:
-                    value_name = precision(value, 2)
-                    if lego:
-                        mesh = volume.legosurface(vmin=value)
-                        if mesh.ncells:
-                            mesh.cmap(cmap, vmin=scrange[0], vmax=scrange[1], on="cells")
-                    else:
-                        mesh = volume.isosurface(value).color(c).alpha(alpha)
-                    bacts.update({value_name: mesh})  # store it
+                for i, value in enumerate(allowed_vals):
+                    bacts[i] = generate(value)  # store it
 
-            ### isovalue slider callback
-            def slider_isovalue(widget, event):
+            def set_isovalue(value):
 
                 prevact = self.vol_actors[0]
-                if isinstance(widget, float):
-                    value = widget
-                else:
-                    value = widget.GetRepresentation().GetValue()
 
-                # snap to the closest
-                idx = (np.abs(allowed_vals - value)).argmin()
+                # snap to the closest, the allowed values are evenly spaced
+                idx = min(max(int(round((value - scrange[0]) / step)), 0), res - 1)
                 value = allowed_vals[idx]
 
                 if abs(value - self._prev_value) / delta < 0.001:
                     return
                 self._prev_value = value
 
-                value_name = precision(value, 2)
-                if value_name in bacts:  # reusing the already existing mesh
-                    # print('reusing')
-                    mesh = bacts[value_name]
-                else:  # else generate it
+                mesh = bacts[idx]  # reusing the already existing mesh
+                if mesh is None:  # else generate it
                     # print('generating', value)
-                    if lego:
-                        mesh = volume.legosurface(vmin=value)
-                        if mesh.ncells:
-                            mesh.cmap(cmap, vmin=scrange[0], vmax=scrange[1], on="cells")
-                    else:
-                        mesh = volume.isosurface(value).color(c).alpha(alpha)
-                    bacts.update({value_name: mesh})  # store it
+                    mesh = generate(value)
+                    bacts[idx] = mesh  # store it
 
                 self.remove(prevact).add(mesh)
                 self.vol_actors[0] = mesh
 
+            ### isovalue slider callback
+            def slider_isovalue(widget, event):
+                set_isovalue(widget.GetRepresentation().GetValue())
+
             ################################################
 
             if isovalue is None:
                 isovalue = delta / 3.0 + scrange[0]
 
             self.vol_actors = [None]
-            slider_isovalue(isovalue, "")  # init call
+            set_isovalue(isovalue)  # init call
             if lego:
                 if self.vol_actors[0]:
                     self.vol_actors[0].add_scalarbar(pos=(0.8, 0.12))
@@ -1324,21 +1570,27 @@ class Browser(Plotter):
 
             if k == self._oldk:
                 return  # no change
-            self._oldk = k
+            oldk, self._oldk = self._oldk, k
 
             n = len(objects)
-            m = len(objects[0])
-            for i in range(n):
-                for j in range(m):
-                    ak = objects[i][j]
-                    try:
-                        if j == k:
-                            ak.on()
-                            akon = ak
-                        else:
-                            ak.off()
-                    except AttributeError:
-                        pass
+            # only the previous column needs to be switched off,
+            # except at the first call where all the others are
+            if oldk is None:
+                offs = [ak for ob in objects for j, ak in enumerate(ob) if j != k]
+            else:
+                offs = [ob[oldk] for ob in objects]
+            for ak in offs:
+                try:
+                    ak.off()
+                except AttributeError:
+                    pass
+            akon = None
+            for ob in objects:
+                try:
+                    ob[k].on()
+                    akon = ob[k]
+                except AttributeError:
+                    pass
 
             try:
                 tx = str(k)
@@ -1348,7 +1600,7 @@ class Browser(Plotter):
                     tx = akon.filename.split("/")[-1]
                     tx = tx.split("\\")[-1]  # windows os
                 elif akon.name:
-                    tx = ak.name + " " + tx
+                    tx = akon.name + " " + tx
             except:
                 pass
             self.slider.title = tx
@@ -1415,7 +1667,7 @@ class FreeHandCutPlotter(Plotter):
             -       "z/Z" to cut mesh (Z inverts inside-out the selection area)
             -       "L" to keep only the largest connected surface
             -       "s" to save mesh to file (tag `_edited` is appended to filename)
-            -       "u" to undo last action
+            -       "u" to undo the last actions (up to 8)
             -       "h" for help, "i" for info
 
         Arguments:
@@ -1455,7 +1707,8 @@ class FreeHandCutPlotter(Plotter):
         super().__init__(**options)
 
         self.mesh = mesh
-        self.mesh_prev = mesh
+        self._undo = deque(maxlen=8)  # previous meshes, the last one is restored first
+        self._diag = mesh.diagonal_size()  # refreshed whenever self.mesh changes
         self.splined = splined
         self.linecolor = lc
         self.linewidth = lw
@@ -1476,12 +1729,37 @@ class FreeHandCutPlotter(Plotter):
         self.idmousemove = self.add_callback("MouseMove", self._on_mouse_move)
         self.drawmode = False
         self.tol = tol  # tolerance of point distance
-        self.cpoints = []
+        self._cpoints = _PointBuffer()
         self.points = None
         self.spline = None
         self.jline = None
         self.topline = None
-        self.top_pts = []
+        self._top_pts = _PointBuffer()
+
+    @property
+    def mesh_prev(self):
+        """The mesh that would be restored by the next undo."""
+        return self._undo[-1] if self._undo else self.mesh
+
+    @property
+    def cpoints(self) -> np.ndarray:
+        """The drawn points, as a (n, 3) array."""
+        return self._cpoints.array
+
+    @cpoints.setter
+    def cpoints(self, pts):
+        self._cpoints.clear()
+        self._cpoints.extend(pts)
+
+    @property
+    def top_pts(self) -> np.ndarray:
+        """The points picked on the mesh while drawing, as a (n, 3) array."""
+        return self._top_pts.array
+
+    @top_pts.setter
+    def top_pts(self, pts):
+        self._top_pts.clear()
+        self._top_pts.extend(pts)
 
     def init(self, init_points):
         """Set an initial number of points to define a region"""
@@ -1507,6 +1785,7 @@ class FreeHandCutPlotter(Plotter):
             self.txt2d.background(self.color, self.alpha)
             if len(self.cpoints) > 2:
                 self.remove([self.spline, self.jline])
+                self.jline = None
                 if self.splined:  # show the spline closed
                     self.spline = Spline(self.cpoints, closed=True, res=len(self.cpoints) * 4)
                 else:
@@ -1518,26 +1797,54 @@ class FreeHandCutPlotter(Plotter):
     def _on_mouse_move(self, evt):
         if self.drawmode:
             cpt = self.compute_world_coordinate(evt.picked2d)  # make this 2d-screen point 3d
-            if self.cpoints and mag(cpt - self.cpoints[-1]) < self.mesh.diagonal_size() * self.tol:
-                return  # new point is too close to the last one. skip
-            self.cpoints.append(cpt)
+            if len(self._cpoints):
+                d = cpt - self.cpoints[-1]
+                if d @ d < (self._diag * self.tol) ** 2:
+                    return  # new point is too close to the last one. skip
+            self._cpoints.append(cpt)
             if len(self.cpoints) > 2:
-                self.remove([self.points, self.spline, self.jline, self.topline])
-                self.points = Points(self.cpoints, r=self.linewidth).c(self.pointcolor).pickable(0)
                 if self.splined:
-                    self.spline = Spline(self.cpoints, res=len(self.cpoints) * 4)  # not closed here
+                    # cheap preview while drawing, the closed Spline is fit on the second click
+                    pts = _catmull_rom(self.cpoints, len(self.cpoints) * 4)
+                else:
+                    pts = self.cpoints
+
+                # the actors are created once per selection, then updated in place
+                if self.points is None:
+                    self.remove(self.spline)
+                    self.points = Points(self.cpoints, r=self.linewidth).c(self.pointcolor).pickable(0)
+                    self.spline = Line(pts).lw(self.linewidth).c(self.linecolor).pickable(False)
+                    self.add([self.points, self.spline])
                 else:
-                    self.spline = Line(self.cpoints)
+                    n = self.points.npoints
+                    self.points.vertices = self.cpoints
+                    if self.points.npoints != n:
+                        self.points.dataset.SetVerts(vertex_cells(self.points.npoints))
+                    n = self.spline.npoints
+                    self.spline.vertices = pts
+                    if self.spline.npoints != n:
+                        self.spline.dataset.SetLines(polyline_cells(self.spline.npoints))
+
+                if self.jline is None:
+                    self.jline = Line(self.cpoints[0], self.cpoints[-1], lw=1, c=self.linecolor).pickable(0)
+                    self.add(self.jline)
+                else:
+                    self.jline.vertices = [self.cpoints[0], self.cpoints[-1]]
 
                 if evt.actor:
-                    self.top_pts.append(evt.picked3d)
-                    self.topline = Points(self.top_pts, r=self.linewidth)
-                    self.topline.c(self.linecolor).pickable(False)
+                    self._top_pts.append(evt.picked3d)
+                    if self.topline is None:
+                        self.topline = Points(self.top_pts, r=self.linewidth)
+                        self.topline.c(self.linecolor).pickable(False)
+                        self.add(self.topline)
+                    else:
+                        n = self.topline.npoints
+                        self.topline.vertices = self.top_pts
+                        if self.topline.npoints != n:
+                            self.topline.dataset.SetVerts(vertex_cells(self.topline.npoints))
 
-                self.spline.lw(self.linewidth).c(self.linecolor).pickable(False)
                 self.txt2d.background(self.linecolor)
-                self.jline = Line(self.cpoints[0], self.cpoints[-1], lw=1, c=self.linecolor).pickable(0)
-                self.add([self.points, self.spline, self.jline, self.topline]).render()
+                self.render()
 
     def _on_keypress(self, evt):
         if evt.keypress.lower() == "z" and self.spline:  # Cut mesh with a ribbon-like surface
@@ -1546,12 +1853,13 @@ class FreeHandCutPlotter(Plotter):
                 inv = True
             self.txt2d.background("red8").text("  ... working ...  ")
             self.render()
-            self.mesh_prev = self.mesh.clone()
-            tol = self.mesh.diagonal_size() / 2  # size of ribbon (not shown)
+            self._undo.append(self.mesh.clone())
+            tol = self._diag / 2  # size of ribbon (not shown)
             pts = self.spline.vertices
             n = fit_plane(pts, signed=True).normal  # compute normal vector to points
             rb = Ribbon(pts - tol * n, pts + tol * n, closed=True)
             self.mesh.cut_with_mesh(rb, invert=inv)  # CUT
+            self._diag = self.mesh.diagonal_size()
             self.txt2d.text(self.msg)  # put back original message
             if self.drawmode:
                 self._on_right_click(evt)  # toggle mode to normal
@@ -1559,20 +1867,21 @@ class FreeHandCutPlotter(Plotter):
                 self.txt2d.background(self.color, self.alpha)
             self.remove([self.spline, self.points, self.jline, self.topline]).render()
             self.cpoints, self.points, self.spline = [], None, None
-            self.top_pts, self.topline = [], None
+            self.jline, self.top_pts, self.topline = None, [], None
 
         elif evt.keypress == "L":
             self.txt2d.background("red8")
             self.txt2d.text(" ... removing smaller ... \n ... parts of the mesh ... ")
             self.render()
             self.remove(self.mesh)
-            self.mesh_prev = self.mesh
+            self._undo.append(self.mesh)
             mcut = self.mesh.extract_largest_region()
             mcut.filename = self.mesh.filename  # copy over various properties
             mcut.name = self.mesh.name
             mcut.scalarbar = self.mesh.scalarbar
             mcut.info = self.mesh.info
             self.mesh = mcut                            # discard old mesh by overwriting it
+            self._diag = mcut.diagonal_size()
             self.txt2d.text(self.msg).background(self.color)   # put back original message
             self.add(mcut).render()
 
@@ -1583,15 +1892,18 @@ class FreeHandCutPlotter(Plotter):
                 self.txt2d.background(self.color, self.alpha)
             self.remove([self.mesh, self.spline, self.jline, self.points, self.topline])
             self.mesh = self.mesh_prev
+            if self._undo:
+                self._undo.pop()
+            self._diag = self.mesh.diagonal_size()
             self.cpoints, self.points, self.spline = [], None, None
-            self.top_pts, self.topline = [], None
+            self.jline, self.top_pts, self.topline = None, [], None
             self.add(self.mesh).render()
 
         elif evt.keypress in ("c", "Delete"):
             # clear all points
             self.remove([self.spline, self.points, self.jline, self.topline]).render()
             self.cpoints, self.points, self.spline = [], None, None
-            self.top_pts, self.topline = [], None
+            self.jline, self.top_pts, self.topline = None, [], None
 
         elif evt.keypress == "r":  # reset camera and axes
             try:
@@ -1664,7 +1976,8 @@ class SplinePlotter(Plotter):
         self.pcolor = "purple5"
         self.psize = 10
 
-        self.cpoints = list(init_points)
+        self._cpoints = _PointBuffer()
+        self._cpoints.extend(init_points)
         self.vpoints = None
         self.line = None
 
@@ -1696,6 +2009,15 @@ class SplinePlotter(Plotter):
         self.callid2 = self.add_callback("LeftButtonPress", self._on_left_click)
         self.callid3 = self.add_callback("RightButtonPress", self._on_right_click)
 
+    @property
+    def cpoints(self) -> np.ndarray:
+        """The clicked points, as a (n, 3) array."""
+        return self._cpoints.array
+
+    @cpoints.setter
+    def cpoints(self, pts):
+        self._cpoints.clear()
+        self._cpoints.extend(pts)
 
     def points(self, newpts=None) -> Union["SplinePlotter", np.ndarray]:
         """Retrieve the 3D coordinates of the clicked points"""
@@ -1711,44 +2033,64 @@ class SplinePlotter(Plotter):
         if evt.actor.name == "points":
             # remove clicked point if clicked twice
             pid = self.vpoints.closest_point(evt.picked3d, return_point_id=True)
-            self.cpoints.pop(pid)
+            self._cpoints.pop(pid)
             self.update()
             return
         p = evt.picked3d
-        self.cpoints.append(p)
+        self._cpoints.append(p)
         self.update()
         if self.verbose:
             vedo.colors.printc("Added point:", precision(p, 4), c="g")
 
     def _on_right_click(self, evt):
         if evt.actor and len(self.cpoints) > 0:
-            self.cpoints.pop()  # pop removes from the list the last pt
+            self._cpoints.pop()  # pop removes the last pt
             self.update()
             if self.verbose:
                 vedo.colors.printc("Deleted last point", c="r")
 
     def update(self):
-        self.remove(self.line, self.vpoints)  # remove old points and spline
-        self.vpoints = Points(self.cpoints).ps(self.psize).c(self.pcolor)
-        self.vpoints.name = "points"
-        self.vpoints.pickable(True)  # to allow toggle
         minnr = 1
         if self.splined:
             minnr = 2
+        pts = None
         if self.lwidth and len(self.cpoints) > minnr:
             if self.splined:
                 try:
-                    self.line = Spline(self.cpoints, closed=self.closed, res=self.resolution)
+                    pts = Spline(self.cpoints, closed=self.closed, res=self.resolution).vertices
                 except ValueError:
                     # if clicking too close splining might fail
-                    self.cpoints.pop()
+                    self._cpoints.pop()
+                    self.update()
                     return
             else:
-                self.line = Line(self.cpoints, closed=self.closed)
-            self.line.c(self.lcolor).lw(self.lwidth).pickable(False)
-            self.add(self.vpoints, self.line)
+                pts = self.cpoints
+        # a closed Spline already repeats its first point
+        closed = self.closed and not self.splined
+
+        # the actors are built once, then updated in place
+        if self.vpoints is None:
+            self.vpoints = Points(self.cpoints).ps(self.psize).c(self.pcolor)
+            self.vpoints.name = "points"
+            self.vpoints.pickable(True)  # to allow toggle
         else:
+            n = self.vpoints.npoints
+            self.vpoints.vertices = self.cpoints
+            if self.vpoints.npoints != n:
+                self.vpoints.dataset.SetVerts(vertex_cells(self.vpoints.npoints))
+
+        if pts is None:
+            self.remove(self.line)
             self.add(self.vpoints)
+        else:
+            if self.line is None:
+                self.line = Line(pts, closed=closed).c(self.lcolor).lw(self.lwidth).pickable(False)
+            else:
+                n = self.line.npoints
+                self.line.vertices = pts
+                if self.line.npoints != n:
+                    self.line.dataset.SetLines(polyline_cells(self.line.npoints, closed))
+            self.add(self.vpoints, self.line)
 
     def _key_press(self, evt):
         if evt.keypress == "c":
@@ -1765,6 +2107,14 @@ class SplinePlotter(Plotter):
 
 
 ########################################################################
+def _ramp(n, y0, y1):
+    """Internal use. Interpolate linearly from `y0` to `y1` in `n` steps (only `y0` if `n` is 1)."""
+    x = np.linspace(0, 1, n) if n > 1 else np.zeros(1)
+    return np.multiply.outer(1 - x, np.asarray(y0, dtype=float)) + np.multiply.outer(
+        x, np.asarray(y1, dtype=float)
+    )
+
+
 class Animation(Plotter):
     """
     A `Plotter` derived class that allows to animate simultaneously various objects
@@ -1808,6 +2158,7 @@ class Animation(Plotter):
         self._lastT = None
         self._lastDuration = None
         self._lastActs = None
+        self._rng_cache = {}
         self.eps = 0.00001
 
     def _parse(self, objs, t, duration):
@@ -1836,18 +2187,28 @@ class Animation(Plotter):
             objs2 = [objs]
 
         # quantize time steps and duration
-        t = int(t / self.time_resolution + 0.5) * self.time_resolution
+        it = int(t / self.time_resolution + 0.5)
         nsteps = int(duration / self.time_resolution + 0.5)
+        t = it * self.time_resolution
         duration = nsteps * self.time_resolution
 
-        rng = np.linspace(t, t + duration, nsteps + 1)
+        # bookings over the same interval share one read-only array of time steps
+        key = (it, nsteps, self.time_resolution)
+        rng = self._rng_cache.get(key)
+        if rng is None:
+            rng = np.linspace(t, t + duration, nsteps + 1)
+            rng.setflags(write=False)
+            self._rng_cache[key] = rng
 
         self._lastT = t
         self._lastDuration = duration
         self._lastActs = objs2
 
+        # one set of the ids currently in self.objects, instead of a list scan per actor
+        present = set(map(id, self.objects))
         for a in objs2:
-            if a not in self.objects:
+            if id(a) not in present:
+                present.add(id(a))
                 self.objects.append(a)
 
         return objs2, t, duration, rng
@@ -1864,9 +2225,10 @@ class Animation(Plotter):
         """Gradually switch on the input list of meshes by increasing opacity."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = lin_interpolate(tt, [t, t + duration], [0, 1])
-                self.events.append((tt, self.fade_in, acts, alpha))
+            alphas = _ramp(len(rng), 0, 1)
+            append = self.events.append
+            for tt, alpha in zip(rng.tolist(), alphas.tolist()):
+                append((tt, self.fade_in, acts, alpha))
         else:
             for a in self._performers:
                 if hasattr(a, "alpha"):
@@ -1879,9 +2241,10 @@ class Animation(Plotter):
         """Gradually switch off the input list of meshes by increasing transparency."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = lin_interpolate(tt, [t, t + duration], [1, 0])
-                self.events.append((tt, self.fade_out, acts, alpha))
+            alphas = _ramp(len(rng), 1, 0)
+            append = self.events.append
+            for tt, alpha in zip(rng.tolist(), alphas.tolist()):
+                append((tt, self.fade_out, acts, alpha))
         else:
             for a in self._performers:
                 if a.alpha() <= self._inputvalues:
@@ -1893,9 +2256,10 @@ class Animation(Plotter):
         """Gradually change transparency for the input list of meshes."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = lin_interpolate(tt, [t, t + duration], [alpha1, alpha2])
-                self.events.append((tt, self.fade_out, acts, alpha))
+            alphas = _ramp(len(rng), alpha1, alpha2)
+            append = self.events.append
+            for tt, alpha in zip(rng.tolist(), alphas.tolist()):
+                append((tt, self.fade_out, acts, alpha))
         else:
             for a in self._performers:
                 a.alpha(self._inputvalues)
@@ -1907,15 +2271,11 @@ class Animation(Plotter):
             acts, t, duration, rng = self._parse(acts, t, duration)
 
             col2 = get_color(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    col1 = a.color()
-                    r = lin_interpolate(tt, [t, t + duration], [col1[0], col2[0]])
-                    g = lin_interpolate(tt, [t, t + duration], [col1[1], col2[1]])
-                    b = lin_interpolate(tt, [t, t + duration], [col1[2], col2[2]])
-                    inputvalues.append((r, g, b))
-                self.events.append((tt, self.change_color, acts, inputvalues))
+            cols = [_ramp(len(rng), a.color(), col2).tolist() for a in acts]
+            append = self.events.append
+            for i, tt in enumerate(rng.tolist()):
+                inputvalues = [tuple(col[i]) for col in cols]
+                append((tt, self.change_color, acts, inputvalues))
         else:
             for i, a in enumerate(self._performers):
                 a.color(self._inputvalues[i])
@@ -1928,18 +2288,16 @@ class Animation(Plotter):
             acts, t, duration, rng = self._parse(acts, t, duration)
 
             col2 = get_color(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    if a.GetBackfaceProperty():
-                        col1 = a.backColor()
-                        r = lin_interpolate(tt, [t, t + duration], [col1[0], col2[0]])
-                        g = lin_interpolate(tt, [t, t + duration], [col1[1], col2[1]])
-                        b = lin_interpolate(tt, [t, t + duration], [col1[2], col2[2]])
-                        inputvalues.append((r, g, b))
-                    else:
-                        inputvalues.append(None)
-                self.events.append((tt, self.change_backcolor, acts, inputvalues))
+            cols = []
+            for a in acts:
+                if a.GetBackfaceProperty():
+                    cols.append(_ramp(len(rng), a.backColor(), col2).tolist())
+                else:
+                    cols.append(None)
+            append = self.events.append
+            for i, tt in enumerate(rng.tolist()):
+                inputvalues = [None if col is None else tuple(col[i]) for col in cols]
+                append((tt, self.change_backcolor, acts, inputvalues))
         else:
             for i, a in enumerate(self._performers):
                 a.backColor(self._inputvalues[i])
@@ -1969,12 +2327,11 @@ class Animation(Plotter):
         """Gradually change line width of the mesh edges for the input list of meshes."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    newlw = lin_interpolate(tt, [t, t + duration], [a.lw(), lw])
-                    inputvalues.append(newlw)
-                self.events.append((tt, self.change_line_width, acts, inputvalues))
+            lws = [_ramp(len(rng), a.lw(), lw).tolist() for a in acts]
+            append = self.events.append
+            for i, tt in enumerate(rng.tolist()):
+                inputvalues = [alw[i] for alw in lws]
+                append((tt, self.change_line_width, acts, inputvalues))
         else:
             for i, a in enumerate(self._performers):
                 a.lw(self._inputvalues[i])
@@ -1985,15 +2342,11 @@ class Animation(Plotter):
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
             col2 = get_color(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    col1 = a.linecolor()
-                    r = lin_interpolate(tt, [t, t + duration], [col1[0], col2[0]])
-                    g = lin_interpolate(tt, [t, t + duration], [col1[1], col2[1]])
-                    b = lin_interpolate(tt, [t, t + duration], [col1[2], col2[2]])
-                    inputvalues.append((r, g, b))
-                self.events.append((tt, self.change_line_color, acts, inputvalues))
+            cols = [_ramp(len(rng), a.linecolor(), col2).tolist() for a in acts]
+            append = self.events.append
+            for i, tt in enumerate(rng.tolist()):
+                inputvalues = [tuple(col[i]) for col in cols]
+                append((tt, self.change_line_color, acts, inputvalues))
         else:
             for i, a in enumerate(self._performers):
                 a.linecolor(self._inputvalues[i])
@@ -2016,20 +2369,16 @@ class Animation(Plotter):
             else:
                 vedo.logger.error(f"Unknown lighting style {style}")
 
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    pr = a.properties
-                    aa = pr.GetAmbient()
-                    ad = pr.GetDiffuse()
-                    asp = pr.GetSpecular()
-                    aspp = pr.GetSpecularPower()
-                    naa = lin_interpolate(tt, [t, t + duration], [aa, pars[0]])
-                    nad = lin_interpolate(tt, [t, t + duration], [ad, pars[1]])
-                    nasp = lin_interpolate(tt, [t, t + duration], [asp, pars[2]])
-                    naspp = lin_interpolate(tt, [t, t + duration], [aspp, pars[3]])
-                    inputvalues.append((naa, nad, nasp, naspp))
-                self.events.append((tt, self.change_lighting, acts, inputvalues))
+            # ambient, diffuse, specular and specular power, interpolated together
+            lights = []
+            for a in acts:
+                pr = a.properties
+                vals = (pr.GetAmbient(), pr.GetDiffuse(), pr.GetSpecular(), pr.GetSpecularPower())
+                lights.append(_ramp(len(rng), vals, pars[:4]).tolist())
+            append = self.events.append
+            for i, tt in enumerate(rng.tolist()):
+                inputvalues = [tuple(light[i]) for light in lights]
+                append((tt, self.change_lighting, acts, inputvalues))
         else:
             for i, a in enumerate(self._performers):
                 pr = a.properties
@@ -2049,14 +2398,14 @@ class Animation(Plotter):
             cpos = acts[0].pos()
             pt = np.array(pt)
             dv = (pt - cpos) / len(rng)
-            for j, tt in enumerate(rng):
-                i = j + 1
-                if "quad" in style:
-                    x = i / len(rng)
-                    y = x * x
-                    self.events.append((tt, self.move, acts, cpos + dv * i * y))
-                else:
-                    self.events.append((tt, self.move, acts, cpos + dv * i))
+            # all the positions at once, one row per time step
+            i = np.arange(1, len(rng) + 1)
+            if "quad" in style:
+                i = i * (i / len(rng)) ** 2
+            positions = cpos + np.multiply.outer(i, dv)
+            append = self.events.append
+            for tt, p in zip(rng.tolist(), positions):
+                append((tt, self.move, acts, p))
         else:
             self._performers[0].pos(self._inputvalues)
         return self
@@ -2067,26 +2416,32 @@ class Animation(Plotter):
             acts, t, duration, rng = self._parse(act, t, duration)
             if len(acts) != 1:
                 vedo.logger.error("in rotate(), can move only one object.")
+            # resolve the rotation method once, at booking time
+            rotation = None
+            if isinstance(axis, str):
+                rotation = {
+                    "x": acts[0].rotate_x,
+                    "y": acts[0].rotate_y,
+                    "z": acts[0].rotate_z,
+                }.get(axis)
+            ang = angle / len(rng)
+            append = self.events.append
             for tt in rng:
-                ang = angle / len(rng)
-                self.events.append((tt, self.rotate, acts, (axis, ang)))
+                append((tt, self.rotate, acts, (rotation, ang)))
         else:
-            ax = self._inputvalues[0]
-            if ax == "x":
-                self._performers[0].rotate_x(self._inputvalues[1])
-            elif ax == "y":
-                self._performers[0].rotate_y(self._inputvalues[1])
-            elif ax == "z":
-                self._performers[0].rotate_z(self._inputvalues[1])
+            rotation, ang = self._inputvalues
+            if rotation is not None:
+                rotation(ang)
         return self
 
     def scale(self, acts=None, factor=1, t=None, duration=None):
         """Smoothly scale a specific object to a specified scale factor."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                fac = lin_interpolate(tt, [t, t + duration], [1, factor])
-                self.events.append((tt, self.scale, acts, fac))
+            facs = _ramp(len(rng), 1, factor)
+            append = self.events.append
+            for tt, fac in zip(rng.tolist(), facs.tolist()):
+                append((tt, self.scale, acts, fac))
         else:
             for a in self._performers:
                 a.scale(self._inputvalues)
@@ -2101,7 +2456,7 @@ class Animation(Plotter):
             if len(acts) != 1:
                 vedo.logger.error("in meshErode(), can erode only one object.")
             diag = acts[0].diagonal_size()
-            x0, x1, y0, y1, z0, z1 = acts[0].GetBounds()
+            x0, x1, y0, y1, z0, z1 = acts[0].bounds()
             corners = [
                 (x0, y0, z0),
                 (x1, y0, z0),
@@ -2114,18 +2469,26 @@ class Animation(Plotter):
             ]
             pcl = acts[0].closest_point(corners[corner])
             dmin = np.linalg.norm(pcl - corners[corner])
-            for tt in rng:
-                d = lin_interpolate(tt, [t, t + duration], [dmin, diag * 1.01])
+            # sort the points by distance to the corner once, then each radius
+            # query is a binary search on the sorted distances
+            dists = np.linalg.norm(acts[0].vertices - corners[corner], axis=1)
+            order = np.argsort(dists)
+            dists = dists[order]
+            radii = _ramp(len(rng), dmin, diag * 1.01)
+            append = self.events.append
+            for tt, d in zip(rng.tolist(), radii.tolist()):
                 if d > 0:
-                    ids = acts[0].closest_point(corners[corner], radius=d, return_point_id=True)
+                    ids = order[: np.searchsorted(dists, d, side="left")]
                     if len(ids) <= acts[0].npoints:
-                        self.events.append((tt, self.mesh_erode, acts, ids))
+                        append((tt, self.mesh_erode, acts, ids))
         return self
 
     def play(self):
         """Play the internal list of events and save a video."""
 
-        self.events = sorted(self.events, key=lambda x: x[0])
+        # stable sort of the events by their time
+        times = np.fromiter((e[0] for e in self.events), dtype=float, count=len(self.events))
+        self.events = [self.events[i] for i in np.argsort(times, kind="stable").tolist()]
         self.bookingMode = False
 
         if self.show_progressbar:
@@ -2137,6 +2500,12 @@ class Animation(Plotter):
         if self.video_filename:
             vd = vedo.Video(self.video_filename, fps=self.video_fps, duration=self.total_duration)
 
+        # local names for the attributes used at every event
+        show, resetcam = self.show, self.resetcam
+        eps, tres = self.eps, self.time_resolution
+        save_video = bool(self.video_filename)
+        show_progressbar = self.show_progressbar
+
         ttlast = 0
         for e in self.events:
 
@@ -2144,18 +2513,18 @@ class Animation(Plotter):
             action(0, 0)
 
             dt = tt - ttlast
-            if dt > self.eps:
-                self.show(interactive=False, resetcam=self.resetcam)
-                if self.video_filename:
+            if dt > eps:
+                show(interactive=False, resetcam=resetcam)
+                if save_video:
                     vd.add_frame()
 
-                if dt > self.time_resolution + self.eps:
-                    if self.video_filename:
+                if dt > tres + eps:
+                    if save_video:
                         vd.pause(dt)
 
             ttlast = tt
 
-            if self.show_progressbar:
+            if show_progressbar:
                 pb.print("t=" + str(int(tt * 100) / 100) + "s,  " + action.__name__)
 
         self.show(interactive=False, resetcam=self.resetcam)
@@ -2417,15 +2786,15 @@ class Clock(vedo.Assembly):
         m = int(m) % 60
         t = (h * 60 + m) / 12 / 60
 
-        alpha = 2 * np.pi * t + np.pi / 2
-        beta = 12 * 2 * np.pi * t + np.pi / 2
+        alpha = 2 * math.pi * t + math.pi / 2
+        beta = 12 * 2 * math.pi * t + math.pi / 2
 
-        x1, y1 = np.cos(alpha), np.sin(alpha)
-        x2, y2 = np.cos(beta), np.sin(beta)
+        x1, y1 = math.cos(alpha), math.sin(alpha)
+        x2, y2 = math.cos(beta), math.sin(beta)
         if s is not None:
             s = int(s) % 60
-            gamma = s * 2 * np.pi / 60 + np.pi / 2
-            x3, y3 = np.cos(gamma), np.sin(gamma)
+            gamma = s * 2 * math.pi / 60 + math.pi / 2
+            x3, y3 = math.cos(gamma), math.sin(gamma)
 
         ore = Line([0, 0], [x1, y1], lw=14, c="red4").scale(0.5).mirror()
         minu = Line([0, 0], [x2, y2], lw=7, c="blue3").scale(0.75).mirror()
@@ -2458,27 +2827,28 @@ class Clock(vedo.Assembly):
         m = int(m) % 60
         t = (h * 60 + m) / 12 / 60
 
-        alpha = 2 * np.pi * t + np.pi / 2
-        beta = 12 * 2 * np.pi * t + np.pi / 2
+        alpha = 2 * math.pi * t + math.pi / 2
+        beta = 12 * 2 * math.pi * t + math.pi / 2
 
-        x1, y1 = np.cos(alpha), np.sin(alpha)
-        x2, y2 = np.cos(beta), np.sin(beta)
+        x1, y1 = math.cos(alpha), math.sin(alpha)
+        x2, y2 = math.cos(beta), math.sin(beta)
         if s is not None:
             s = int(s) % 60
-            gamma = s * 2 * np.pi / 60 + np.pi / 2
-            x3, y3 = np.cos(gamma), np.sin(gamma)
+            gamma = s * 2 * math.pi / 60 + math.pi / 2
+            x3, y3 = math.cos(gamma), math.sin(gamma)
 
-        pts2 = parts[2].vertices
-        pts2[1] = [-x1 * 0.5, y1 * 0.5, 0.001]
-        parts[2].vertices = pts2
+        # move the tip of each hand in place, no need to copy the whole arrays
+        vpts = parts[2].dataset.GetPoints()
+        vpts.SetPoint(1, -x1 * 0.5, y1 * 0.5, 0.001)
+        vpts.Modified()
 
-        pts3 = parts[3].vertices
-        pts3[1] = [-x2 * 0.75, y2 * 0.75, 0.002]
-        parts[3].vertices = pts3
+        vpts = parts[3].dataset.GetPoints()
+        vpts.SetPoint(1, -x2 * 0.75, y2 * 0.75, 0.002)
+        vpts.Modified()
 
         if s is not None:
-            pts4 = parts[4].vertices
-            pts4[1] = [-x3 * 0.95, y3 * 0.95, 0.003]
-            parts[4].vertices = pts4
+            vpts = parts[4].dataset.GetPoints()
+            vpts.SetPoint(1, -x3 * 0.95, y3 * 0.95, 0.003)
+            vpts.Modified()
 
         return self
@@ -3,6 +3,7 @@
 import os
 import sys
 import time
+from importlib.util import find_spec
 
 import numpy as np
 import vedo.vtkclasses as vtki
@@ -27,14 +28,14 @@ __all__ = [
 ]
 
 
-try:
-    import matplotlib
+# matplotlib is slow to import: only check that it is installed
+# and import it when a color map is actually needed in color_map()
+if find_spec("matplotlib") is not None:
     _has_matplotlib = True
     cmaps = {}
-except ModuleNotFoundError:
+else:
     from vedo.cmaps import cmaps
     _has_matplotlib = False
-    # see below, this is dealt with in color_map()
 
 #########################################################
 # handy global shortcuts for terminal printing
@@ -692,11 +693,8 @@ emoji = {
 
 # terminal or notebook can do color print
 def _has_colors(stream):
-    try:
-        import IPython
+    if find_spec("IPython") is not None:
         return True
-    except:
-        pass
 
     if not hasattr(stream, "isatty"):
         return False
@@ -910,6 +908,7 @@ def color_map(value, name="jet", vmin=None, vmax=None):
 
     if _has_matplotlib:
         # matplotlib is available, use it! ###########################
+        import matplotlib
         if isinstance(name, str):
             mp = matplotlib.colormaps[name]
         else:
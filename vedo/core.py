@@ -840,6 +840,10 @@ class CommonAlgorithms:
         arr = utils.numpy2vtk(pts, dtype=np.float32)
         try:
             vpts = self.dataset.GetPoints()
+            if vpts is None:
+                # e.g. an empty Points() object, which has no vtkPoints yet
+                vpts = vtki.vtkPoints()
+                self.dataset.SetPoints(vpts)
             vpts.SetData(arr)
             vpts.Modified()
         except (AttributeError, TypeError):
@@ -1994,8 +1998,10 @@ class VolumeAlgorithms(CommonAlgorithms):
             cf.SetValue(0, value)
 
         cf.Update()
-        poly = cf.GetOutput()
+        return self._isosurface_mesh(cf.GetOutput(), scrange)
 
+    def _isosurface_mesh(self, poly, scrange) -> "vedo.mesh.Mesh":
+        # wrap the output of an isosurface filter run on this object into a Mesh
         out = vedo.mesh.Mesh(poly, c=None).phong()
         out.mapper.SetScalarRange(scrange[0], scrange[1])
 
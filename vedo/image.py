@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 from weakref import ref as weak_ref_to
+from weakref import WeakKeyDictionary
 from typing import Tuple, List, Union, Any
 from typing_extensions import Self
 
@@ -25,6 +26,28 @@ __all__ = [
 ]
 
 
+# rasterized matplotlib figures, dropped as soon as a figure is redrawn
+_figure_cache = WeakKeyDictionary()
+
+
+def _get_figure_array(fig) -> np.ndarray:
+    # rasterize a matplotlib figure into a (height, width, 3) uint8 array
+    if not fig.stale and fig in _figure_cache:
+        return _figure_cache[fig]
+
+    fig.tight_layout(pad=1)
+    fig.canvas.draw()
+    arr = np.array(fig.canvas.buffer_rgba(), dtype=np.uint8)[:, :, :3]
+
+    def _invalidate(_event):
+        _figure_cache.pop(fig, None)
+        fig.canvas.mpl_disconnect(cid)
+
+    cid = fig.canvas.mpl_connect("draw_event", _invalidate)
+    _figure_cache[fig] = arr
+    return arr
+
+
 #################################################
 def _get_img(obj: Union[np.ndarray, str], flip=False, translate=()) -> vtki.vtkImageData:
     # compute vtkImageData from numpy array or filename
@@ -54,22 +77,16 @@ def _get_img(obj: Union[np.ndarray, str], flip=False, translate=()) -> vtki.vtkI
         obj = np.asarray(obj)
 
         if obj.ndim == 3:  # has shape (nx,ny, ncolor_alpha_chan)
-            iac = vtki.new("ImageAppendComponents")
             nchan = obj.shape[2]  # get number of channels in inputimage (L/LA/RGB/RGBA)
-            for i in range(nchan):
-                if flip:
-                    arr = np.flip(np.flip(obj[:, :, i], 0), 0).ravel()
-                else:
-                    arr = np.flip(obj[:, :, i], 0).ravel()
-                arr = np.clip(arr, 0, 255)
-                varb = utils.numpy2vtk(arr, dtype=np.uint8, name="RGBA")
-                imgb = vtki.vtkImageData()
-                imgb.SetDimensions(obj.shape[1], obj.shape[0], 1)
-                imgb.GetPointData().AddArray(varb)
-                imgb.GetPointData().SetActiveScalars("RGBA")
-                iac.AddInputData(imgb)
-            iac.Update()
-            img = iac.GetOutput()
+            arr = obj if flip else np.flip(obj, 0)
+            if arr.dtype != np.uint8:  # uint8 data needs no clipping
+                arr = np.clip(arr, 0, 255).astype(np.uint8)
+            # all channels go into a single multi-component array
+            varb = utils.numpy2vtk(arr.reshape(-1, nchan), name="RGBA")
+            img = vtki.vtkImageData()
+            img.SetDimensions(obj.shape[1], obj.shape[0], 1)
+            img.GetPointData().AddArray(varb)
+            img.GetPointData().SetActiveScalars("RGBA")
 
         elif obj.ndim == 2:  # black and white
             if flip:
@@ -189,17 +206,7 @@ class Image(vedo.visual.ImageVisual):
             fig = obj
             if hasattr(fig, "gcf"):
                 fig = fig.gcf()
-            fig.tight_layout(pad=1)
-            fig.canvas.draw()
-
-            # self.array = np.frombuffer(fig.canvas.tostring_rgb(), dtype=np.uint8)
-            # self.array = self.array.reshape(fig.canvas.get_width_height()[::-1] + (3,))
-            width, height = fig.get_size_inches() * fig.get_dpi()
-            self.array = np.frombuffer(
-                fig.canvas.buffer_rgba(), dtype=np.uint8
-            ).reshape((int(height), int(width), 4))
-            self.array = self.array[:, :, :3]
-
+            self.array = _get_figure_array(fig)
             img = _get_img(self.array)
 
         else:
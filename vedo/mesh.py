@@ -10,7 +10,7 @@ import vedo
 from vedo.colors import get_color
 from vedo.pointcloud import Points
 from vedo.utils import buildPolyData, is_sequence, mag, precision
-from vedo.utils import numpy2vtk, vtk2numpy, OperationNode
+from vedo.utils import numpy2vtk, vtk2numpy, vertex_cells, OperationNode
 from vedo.visual import MeshVisual
 
 __docformat__ = "google"
@@ -52,6 +52,7 @@ class Mesh(MeshVisual, Points):
         super().__init__()
 
         self.name = "Mesh"
+        self._surface_locator = (None, None)  # (mtime, locator), see inside_points()
 
         if inputobj is None:
             # self.dataset = vtki.vtkPolyData()
@@ -65,11 +66,7 @@ class Mesh(MeshVisual, Points):
             # self.dataset.DeepCopy(inputobj) # NO
             self.dataset = inputobj
             if self.dataset.GetNumberOfCells() == 0:
-                carr = vtki.vtkCellArray()
-                for i in range(inputobj.GetNumberOfPoints()):
-                    carr.InsertNextCell(1)
-                    carr.InsertCellPoint(i)
-                self.dataset.SetVerts(carr)
+                self.dataset.SetVerts(vertex_cells(inputobj.GetNumberOfPoints()))
 
         elif isinstance(inputobj, Mesh):
             self.dataset = inputobj.dataset
@@ -1596,6 +1593,43 @@ class Mesh(MeshVisual, Points):
         sep.Update()
         return bool(sep.IsInside(0))
 
+    def _inside_points_mask(self, ptsa: np.ndarray, tol: float, candidates=None) -> np.ndarray:
+        # points outside the bounding box cannot be inside the surface,
+        # so only the remaining candidates are passed on to the ray casting
+        b = np.array(self.bounds())
+        d = tol * self.diagonal_size()
+        inbox = np.all((ptsa >= b[::2] - d) & (ptsa <= b[1::2] + d), axis=1)
+        if candidates is not None:
+            inbox &= candidates
+
+        mask = np.zeros(len(ptsa), dtype=bool)
+        if inbox.any():
+            # the surface cell locator is built once, and reused
+            # by the later calls until the mesh is modified
+            surf = self.dataset
+            if self._surface_locator[0] != surf.GetMTime():
+                locator = vtki.new("StaticCellLocator")
+                locator.SetDataSet(surf)
+                locator.BuildLocator()
+                self._surface_locator = (surf.GetMTime(), locator)
+            locator = self._surface_locator[1]
+
+            # same ray casting as vtkSelectEnclosedPoints, which draws the rays
+            # of the i-th point from a pool of random numbers at index i
+            pool = vtki.new("RandomPool")
+            pool.SetSize(max(len(ptsa), 1500))
+            pool.GeneratePool()
+            bds, length = surf.GetBounds(), surf.GetLength()
+            counter = vtki.get_class("IntersectionCounter")(tol * length, length)
+            ids, cell = vtki.vtkIdList(), vtki.new("GenericCell")
+            is_inside = vtki.get_class("SelectEnclosedPoints").IsInsideSurface
+            cids = np.flatnonzero(inbox)
+            mask[cids] = [
+                is_inside(p, surf, bds, length, tol, locator, ids, cell, counter, pool, i)
+                for i, p in zip(cids.tolist(), ptsa[cids].tolist())
+            ]
+        return mask
+
     def inside_points(self, pts: Union["Points", list], invert=False, tol=1e-05, return_ids=False) -> Union["Points", np.ndarray]:
         """
         Return the point cloud that is inside mesh surface as a new Points object.
@@ -1612,29 +1646,20 @@ class Mesh(MeshVisual, Points):
             ![](https://vedo.embl.es/images/basic/pca.png)
         """
         if isinstance(pts, Points):
-            poly = pts.dataset
             ptsa = pts.vertices
         else:
             ptsa = np.asarray(pts)
-            vpoints = vtki.vtkPoints()
-            vpoints.SetData(numpy2vtk(ptsa, dtype=np.float32))
-            poly = vtki.vtkPolyData()
-            poly.SetPoints(vpoints)
 
-        sep = vtki.new("SelectEnclosedPoints")
-        # sep = vtki.new("ExtractEnclosedPoints()
-        sep.SetTolerance(tol)
-        sep.SetInputData(poly)
-        sep.SetSurfaceData(self.dataset)
-        sep.SetInsideOut(invert)
-        sep.Update()
+        mask = self._inside_points_mask(ptsa, tol)
 
-        varr = sep.GetOutput().GetPointData().GetArray("SelectedPoints")
-        mask = vtk2numpy(varr).astype(bool)
-        ids = np.array(range(len(ptsa)), dtype=int)[mask]
+        if invert:
+            outmask = ~mask
+        else:
+            outmask = mask
+        ids = np.flatnonzero(outmask)
 
         if isinstance(pts, Points):
-            varr.SetName("IsInside")
+            varr = numpy2vtk(outmask, dtype=np.uint8, name="IsInside")
             pts.dataset.GetPointData().AddArray(varr)
 
         if return_ids:
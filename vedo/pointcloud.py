@@ -397,6 +397,8 @@ def pca_ellipsoid(points: Union[np.ndarray, "vedo.Points"], pvalue=0.673, res=24
     A value of 0 means a perfect sphere.
 
     Arguments:
+        points : (Points, list)
+            input points, arrays can also be in the form `[allx, ally, allz]`
         pvalue : (float)
             ellipsoid will include this fraction of points
    
@@ -413,19 +415,28 @@ def pca_ellipsoid(points: Union[np.ndarray, "vedo.Points"], pvalue=0.673, res=24
     if isinstance(points, Points):
         coords = points.vertices
     else:
-        coords = points
+        coords = np.asarray(points)
+        if coords.ndim == 2 and coords.shape[0] == 3 and coords.shape[1] > 3:
+            coords = coords.T  # a (3, N) layout, keep it column-major below
     if len(coords) < 4:
         vedo.logger.warning("in pca_ellipsoid(), not enough input points!")
         return None
 
-    P = np.array(coords, ndmin=2, dtype=float)
-    cov = np.cov(P, rowvar=0)     # type: ignore
-    _, s, R = np.linalg.svd(cov)  # singular value decomposition
+    # single precision is enough for the cloud (vertices are stored as float32),
+    # only the centroid and the 3x3 covariance are promoted to double
+    P = np.array(coords, ndmin=2, dtype=np.float32)
+    center = np.mean(P, axis=0, dtype=np.float64)  # centroid of the hyperellipsoid
+    P -= center.astype(np.float32)  # P is our own copy, center it in place
+    cov = (P.T @ P).astype(np.float64) / (len(P) - 1)
+    s, R = np.linalg.eigh(cov)    # cov is real symmetric
+    s = np.clip(s[::-1], 0, None) # eigenvalues sorted largest first
+    R = R[:, ::-1].T              # eigenvectors as rows
+    if np.linalg.det(R) < 0:
+        R[2] *= -1                # keep a right-handed frame
     p, n = s.size, P.shape[0]
     fppf = f.ppf(pvalue, p, n-p)*(n-1)*p*(n+1)/n/(n-p)  # f % point function
     u = np.sqrt(s*fppf)
     ua, ub, uc = u                # semi-axes (largest first)
-    center = np.mean(P, axis=0)   # centroid of the hyperellipsoid
 
     t = LinearTransform(R.T * u).translate(center)
     elli = vedo.shapes.Ellipsoid((0,0,0), (1,0,0), (0,1,0), (0,0,1), res=res)
@@ -544,11 +555,7 @@ class Points(PointsVisual, PointAlgorithms):
         elif isinstance(inputobj, vtki.vtkPolyData):
             self.dataset = inputobj
             if self.dataset.GetNumberOfCells() == 0:
-                carr = vtki.vtkCellArray()
-                for i in range(self.dataset.GetNumberOfPoints()):
-                    carr.InsertNextCell(1)
-                    carr.InsertCellPoint(i)
-                self.dataset.SetVerts(carr)
+                self.dataset.SetVerts(utils.vertex_cells(self.dataset.GetNumberOfPoints()))
 
         elif isinstance(inputobj, Points):
             self.dataset = inputobj.dataset
@@ -1662,11 +1669,7 @@ class Points(PointsVisual, PointAlgorithms):
         removal.Update()
         inputobj = removal.GetOutput()
         if inputobj.GetNumberOfCells() == 0:
-            carr = vtki.vtkCellArray()
-            for i in range(inputobj.GetNumberOfPoints()):
-                carr.InsertNextCell(1)
-                carr.InsertCellPoint(i)
-            inputobj.SetVerts(carr)
+            inputobj.SetVerts(utils.vertex_cells(inputobj.GetNumberOfPoints()))
         self._update(removal.GetOutput())
         self.pipeline = utils.OperationNode("remove_outliers", parents=[self])
         return self
@@ -3855,9 +3855,8 @@ def CornerHistogram(
 
     n = values.shape[0]
     if nmax and nmax < n:
-        # subsample:
-        idxs = np.linspace(0, n, num=int(nmax), endpoint=False).astype(int)
-        values = values[idxs]
+        # subsample with a strided view, no index array nor copy
+        values = values[:: -(-n // int(nmax))]
 
     fs, edges = np.histogram(values, bins=bins, range=vrange)
 
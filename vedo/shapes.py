@@ -2810,11 +2810,79 @@ class Ellipsoid(Mesh):
 
         super().__init__(elli_source.GetOutput(), c, alpha)
 
+        # connectivity of the untouched sphere, see inside_points()
+        self._sphere_cells = self.cells_as_flat_array.copy()
+
         matrix = np.c_[self.axis1, self.axis2, self.axis3]
         lt = LinearTransform(matrix).translate(pos)
         self.apply_transform(lt)
         self.name = "Ellipsoid"
 
+    def inside_points(self, pts: Union["Points", list], invert=False, tol=1e-05, return_ids=False) -> Union["Points", np.ndarray]:
+        """
+        Return the point cloud that is inside the ellipsoid as a new Points object.
+
+        As long as the ellipsoid surface is untouched (up to a linear transformation)
+        most points are classified analytically in its reference frame, and only
+        the ones close to the surface go through `Mesh.inside_points()`.
+        The result and the arguments are the same as for `Mesh.inside_points()`.
+        """
+        T = self.transform
+        cells = getattr(self, "_sphere_cells", None)
+        if (
+            not isinstance(T, LinearTransform)
+            or cells is None
+            or not np.array_equal(self.cells_as_flat_array, cells)
+        ):
+            return super().inside_points(pts, invert, tol, return_ids)
+
+        M = T.matrix
+        Minv = np.linalg.inv(M[:3, :3]).T
+        b = M[:3, 3]
+
+        # the mesh vertices must still sit on the unit sphere in the local frame
+        q = (self.vertices - b) @ Minv
+        if not np.allclose(np.einsum("ij,ij->i", q, q), 1, atol=1e-03):
+            return super().inside_points(pts, invert, tol, return_ids)
+
+        # the triangulated surface lies between the unit sphere and the sphere
+        # touching its closest face, so only the points in between (widened by
+        # the tolerance) need the general test
+        tri = q[cells.reshape(-1, 4)[:, 1:]]
+        normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        area2 = np.linalg.norm(normals, axis=1)
+        normals = normals[area2 > 0] / area2[area2 > 0, None]  # skip degenerate faces
+        rmin = np.abs(np.einsum("ij,ij->i", normals, tri[area2 > 0, 0])).min()
+        margin = tol * self.diagonal_size() / np.linalg.svd(M[:3, :3], compute_uv=False).min()
+
+        ptsa = pts.vertices if isinstance(pts, Points) else np.asarray(pts)
+        ptsa = utils.make3d(ptsa)
+        q = (ptsa - b) @ Minv
+        rho = np.sqrt(np.einsum("ij,ij->i", q, q))  # 1 on the ellipsoid
+        mask = rho < rmin - margin
+        band = (rho >= rmin - margin) & (rho <= 1 + margin)
+        if band.any():
+            mask |= self._inside_points_mask(ptsa, tol, candidates=band)
+        if invert:
+            mask = ~mask
+        ids = np.flatnonzero(mask)
+
+        if isinstance(pts, Points):
+            varr = utils.numpy2vtk(mask, dtype=np.uint8, name="IsInside")
+            pts.dataset.GetPointData().AddArray(varr)
+
+        if return_ids:
+            return ids
+
+        pcl = Points(ptsa[ids])
+        pcl.name = "InsidePoints"
+        pcl.pipeline = utils.OperationNode(
+            "inside_points",
+            parents=[self, ptsa],
+            comment=f"#pts {pcl.dataset.GetNumberOfPoints()}",
+        )
+        return pcl
+
     def asphericity(self) -> float:
         """
         Return a measure of how different an ellipsoid is from a sphere.
@@ -868,6 +868,25 @@ def geometry(obj, extent=None) -> "vedo.Mesh":
     return vedo.Mesh(gf.GetOutput())
 
 
+def vertex_cells(npts: int) -> vtki.vtkCellArray:
+    """Internal use. Build a `vtkCellArray` made of one vertex cell per point."""
+    ids = np.arange(npts)
+    cells = np.c_[np.ones_like(ids), ids].ravel()  # [1,id0, 1,id1, ...]
+    carr = vtki.vtkCellArray()
+    carr.SetCells(npts, numpy2vtk(cells, dtype="id"))
+    return carr
+
+
+def polyline_cells(npts: int, closed=False) -> vtki.vtkCellArray:
+    """Internal use. Build a `vtkCellArray` made of a single polyline through all the points."""
+    ids = np.arange(npts)
+    if closed:
+        ids = np.r_[ids, 0]
+    carr = vtki.vtkCellArray()
+    carr.SetCells(1, numpy2vtk(np.r_[len(ids), ids], dtype="id"))
+    return carr
+
+
 def buildPolyData(vertices, faces=None, lines=None, strips=None, index_offset=0) -> vtki.vtkPolyData:
     """
     Build a `vtkPolyData` object from a list of vertices
@@ -985,11 +1004,7 @@ def buildPolyData(vertices, faces=None, lines=None, strips=None, index_offset=0)
         poly.SetStrips(tscells)
 
     if faces is None and lines is None and strips is None:
-        source_vertices = vtki.vtkCellArray()
-        for i in range(len(vertices)):
-            source_vertices.InsertNextCell(1)
-            source_vertices.InsertCellPoint(i)
-        poly.SetVerts(source_vertices)
+        poly.SetVerts(vertex_cells(len(vertices)))
 
     # print("buildPolyData \n",
     #     poly.GetNumberOfPoints(),
@@ -1003,17 +1018,26 @@ def buildPolyData(vertices, faces=None, lines=None, strips=None, index_offset=0)
 
 
 ##############################################################################
+_font_paths = {}  # successfully resolved font files, see get_font_path()
+
+
 def get_font_path(font: str) -> str:
-    """Internal use."""
-    if font in vedo.settings.font_parameters.keys():
-        if vedo.settings.font_parameters[font]["islocal"]:
+    """Internal use. Successfully resolved font paths are cached."""
+    params = vedo.settings.font_parameters.get(font)
+    # the key follows later edits of settings.font_parameters
+    key = (font, None if params is None else params["islocal"])
+    if key in _font_paths:
+        return _font_paths[key]
+
+    if params is not None:
+        if params["islocal"]:
             fl = os.path.join(vedo.fonts_path, f"{font}.ttf")
         else:
             try:
                 fl = vedo.file_io.download(f"https://vedo.embl.es/fonts/{font}.ttf", verbose=False)
             except:
                 vedo.logger.warning(f"Could not download https://vedo.embl.es/fonts/{font}.ttf")
-                fl = os.path.join(vedo.fonts_path, "Normografo.ttf")
+                return os.path.join(vedo.fonts_path, "Normografo.ttf")
     else:
         if font.startswith("https://"):
             fl = vedo.file_io.download(font, verbose=False)
@@ -1033,7 +1057,8 @@ def get_font_path(font: str) -> str:
                     f"Check out https://vedo.embl.es/fonts for additional fonts\n"
                     f"Type 'vedo -r fonts' to see available fonts"
                 )
-            fl = get_font_path(vedo.settings.default_font)
+            return get_font_path(vedo.settings.default_font)
+    _font_paths[key] = fl
     return fl
 
 
@@ -121,6 +121,7 @@ for name in [
     "vtkLookupTable",
     "vtkMath",
     "vtkPoints",
+    "vtkRandomPool",
     "vtkStringArray",
     "vtkUnsignedCharArray",
     "vtkVariant",
@@ -170,12 +171,14 @@ for name in [
     "vtkDataObject",
     "vtkDataSet",
     "vtkFieldData",
+    "vtkGenericCell",
     "vtkHexagonalPrism",
     "vtkHexahedron",
     "vtkImageData",
     "vtkImplicitDataSet",
     "vtkImplicitSelectionLoop",
     "vtkImplicitWindowFunction",
+    "vtkIntersectionCounter",
     "vtkIterativeClosestPointTransform",
     "vtkLine",
     "vtkMultiBlockDataSet",